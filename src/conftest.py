@@ -10,7 +10,10 @@ from __future__ import annotations
 
 import inspect
 from pathlib import Path
-from typing import Any, Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Iterable
 
 import pytest
 from _pytest.doctest import (
@@ -162,22 +165,37 @@ def pytest_addoption(parser):
         dest="doctest",
     )
 
-@pytest.fixture(autouse=True, scope="session")
-def add_imports(doctest_namespace: dict[str, Any]):
+# The globals of sage.all, prepared for injection into doctests; built
+# once on first use so that repeated doctest items do not re-import
+# sage.all or rebuild the namespace dict.
+_SAGE_NAMESPACE: dict[str, Any] | None = None
+
+
+@pytest.fixture(autouse=True)
+def add_imports(doctest_namespace: dict[str, Any], request: pytest.FixtureRequest):
     """
     Add global imports for doctests.
 
     See `pytest documentation <https://docs.pytest.org/en/stable/doctest.html#doctest-namespace-fixture>`.
     """
+    # Skip importing sage.all (which is expensive) when we are not
+    # actually running a doctest, e.g. during ordinary pytest runs.
+    if not isinstance(request.node, DoctestItem):
+        return
+
     # Inject sage.all into each doctest
-    import sage.all
-    dict_all = sage.all.__dict__
+    global _SAGE_NAMESPACE
+    if _SAGE_NAMESPACE is None:
+        import sage.all
+        dict_all = sage.all.__dict__
 
-    # Remove '__package__' item from the globals since it is not
-    # always in the globals in an actual Sage session.
-    dict_all.pop("__package__", None)
+        # Remove '__package__' item from the globals since it is not
+        # always in the globals in an actual Sage session.
+        dict_all.pop("__package__", None)
 
-    sage_namespace = dict(dict_all)
-    sage_namespace["__name__"] = "__main__"
+        _SAGE_NAMESPACE = dict(dict_all)
+        _SAGE_NAMESPACE["__name__"] = "__main__"
 
-    doctest_namespace.update(**sage_namespace)
+    # dict.update with a dict argument takes the C fast path, unlike
+    # keyword-argument unpacking.
+    doctest_namespace.update(_SAGE_NAMESPACE)
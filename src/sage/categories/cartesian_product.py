@@ -16,7 +16,16 @@ from sage.misc.lazy_import import lazy_import
 from sage.categories.covariant_functorial_construction import CovariantFunctorialConstruction, CovariantConstructionCategory
 from sage.categories.pushout import MultivariateConstructionFunctor
 
-native_python_containers = {tuple, list, set, frozenset, range}
+# Lazy to avoid circular imports; resolved on first use, after which the
+# names are plain references with no import-machinery overhead.
+# at_startup needed for Sets because sets_cat instantiates
+# CartesianProductFunctor (whose __init__ calls Sets()) at import time.
+lazy_import('sage.categories.sets_cat', 'Sets', at_startup=True)
+lazy_import('sage.sets.cartesian_product', 'CartesianProduct')
+
+_NATIVE_CONTAINERS = (tuple, list, set, frozenset, range)
+# Kept as an alias for backward compatibility.
+native_python_containers = frozenset(_NATIVE_CONTAINERS)
 
 class CartesianProductFunctor(CovariantFunctorialConstruction, MultivariateConstructionFunctor):
     """
@@ -121,7 +130,6 @@ class CartesianProductFunctor(CovariantFunctorialConstruction, MultivariateConst
         """
         CovariantFunctorialConstruction.__init__(self)
         self._forced_category = category
-        from sage.categories.sets_cat import Sets
         if self._forced_category is not None:
             codomain = self._forced_category
         else:
@@ -175,21 +183,30 @@ class CartesianProductFunctor(CovariantFunctorialConstruction, MultivariateConst
             sage: C.category()
             Category of Cartesian products of finite enumerated sets
         """
-        if any(type(arg) in native_python_containers for arg in args):
-            from sage.categories.sets_cat import Sets
-            S = Sets()
-            args = [S(a, enumerated_set=True) for a in args]
-        elif not args:
+        if not args:
             if self._forced_category is None:
-                from sage.categories.sets_cat import Sets
                 cat = Sets().CartesianProducts()
             else:
                 cat = self._forced_category
-            from sage.sets.cartesian_product import CartesianProduct
             return CartesianProduct((), cat)
-        elif self._forced_category is not None:
+        # isinstance against a tuple of types uses a C-level loop with
+        # early exit; the scan keeps the common all-parents case free
+        # of allocations.
+        needs_wrap = False
+        for a in args:
+            if isinstance(a, _NATIVE_CONTAINERS):
+                needs_wrap = True
+                break
+        if needs_wrap:
+            S = Sets()
+            # Only wrap the native containers; the remaining arguments
+            # are already parents and are passed through unchanged.
+            args = [S(a, enumerated_set=True)
+                    if isinstance(a, _NATIVE_CONTAINERS) else a
+                    for a in args]
+            return super().__call__(args, **kwds)
+        if self._forced_category is not None:
             return super().__call__(args, category=self._forced_category, **kwds)
-
         return super().__call__(args, **kwds)
 
     def __eq__(self, other):
@@ -242,7 +259,7 @@ class CartesianProductsCategory(CovariantConstructionCategory):
 
         """
         # This method is only required for the capital `C`
-        return "Cartesian products of %s" % (self.base_category()._repr_object_names())
+        return f"Cartesian products of {self.base_category()._repr_object_names()}"
 
     def CartesianProducts(self):
         """
@@ -10,9 +10,11 @@ Examples of a finite dimensional Lie algebra with basis
 # ****************************************************************************
 
 from sage.misc.cachefunc import cached_method
+from sage.misc.lazy_attribute import lazy_attribute
 from sage.sets.family import Family
 from sage.categories.lie_algebras import LieAlgebras
 from sage.modules.free_module import FreeModule
+from sage.rings.integer import Integer
 from sage.structure.parent import Parent
 from sage.structure.unique_representation import UniqueRepresentation
 from sage.categories.examples.lie_algebras import LieAlgebraFromAssociative as BaseExample
@@ -88,12 +90,37 @@ class AbelianLieAlgebra(Parent, UniqueRepresentation):
         """
         self._M = M
         cat = LieAlgebras(R).FiniteDimensional().WithBasis()
+        # Computed once here so that _repr_ need not rebuild the basis
+        # matrix; an algebra constructed on a proper submodule may have
+        # a non-identity basis matrix even without an ambient algebra.
+        self._is_ambient = ambient is None and M.basis_matrix().is_one()
         if ambient is None:
             ambient = self
         else:
             cat = cat.Subobjects()
         self._ambient = ambient
         Parent.__init__(self, base=R, category=cat)
+        self._elt_cls = self.element_class
+        # For submodules with a custom basis, M.basis() rebuilds its
+        # sequence on every call; fetch it once.
+        self._M_basis = tuple(M.basis())
+        self._zero_vec = M.zero()
+        # The zero element, stored as a plain attribute so that the
+        # trivial bracket below skips the cached-method wrapper.
+        self._zero_elt = self.zero()
+
+    @lazy_attribute
+    def _basis_elements(self):
+        """
+        The basis elements of ``self``, as a tuple.
+
+        EXAMPLES::
+
+            sage: L = LieAlgebras(QQ).FiniteDimensional().WithBasis().example()
+            sage: L._basis_elements
+            ((1, 0, 0), (0, 1, 0), (0, 0, 1))
+        """
+        return tuple(self._elt_cls(self, b) for b in self._M_basis)
 
     def _repr_(self):
         """
@@ -103,12 +130,13 @@ class AbelianLieAlgebra(Parent, UniqueRepresentation):
             An example of a finite dimensional Lie algebra with basis:
              the 3-dimensional abelian Lie algebra over Rational Field
         """
-        ret = "An example of a finite dimensional Lie algebra with basis:" \
-              " the {}-dimensional abelian Lie algebra over {}".format(
-                         self.dimension(), self.base_ring())
-        B = self._M.basis_matrix()
-        if not B.is_one():
-            ret += " with basis matrix:\n{!r}".format(B)
+        ret = ("An example of a finite dimensional Lie algebra with basis:"
+               f" the {self.dimension()}-dimensional abelian Lie algebra"
+               f" over {self.base_ring()}")
+        if not self._is_ambient:
+            B = self._M.basis_matrix()
+            if not B.is_one():
+                ret += f" with basis matrix:\n{B!r}"
         return ret
 
     def _element_constructor_(self, x):
@@ -131,9 +159,16 @@ class AbelianLieAlgebra(Parent, UniqueRepresentation):
             sage: L(x+y)
             (1, 1, 0)
         """
-        if isinstance(x, AbelianLieAlgebra.Element):
+        cls = self._elt_cls
+        # Exact type match is the common case; it is a cheap pointer
+        # comparison, unlike the isinstance fallback.
+        if type(x) is cls or isinstance(x, AbelianLieAlgebra.Element):
             x = x.value
-        return self.element_class(self, self._M(x))
+        elif isinstance(x, (int, Integer)) and not x:
+            # Return the interned zero rather than building a fresh
+            # zero vector.
+            return self.zero()
+        return cls(self, self._M(x))
 
     @cached_method
     def zero(self):
@@ -146,7 +181,7 @@ class AbelianLieAlgebra(Parent, UniqueRepresentation):
             sage: L.zero()
             (0, 0, 0)
         """
-        return self.element_class(self, self._M.zero())
+        return self._elt_cls(self, self._zero_vec)
 
     def basis_matrix(self):
         """
@@ -226,6 +261,7 @@ class AbelianLieAlgebra(Parent, UniqueRepresentation):
             return False
         return self._M.is_submodule(A._M)
 
+    @cached_method
     def basis(self):
         """
         Return the basis of ``self``.
@@ -234,11 +270,13 @@ class AbelianLieAlgebra(Parent, UniqueRepresentation):
 
             sage: L = LieAlgebras(QQ).FiniteDimensional().WithBasis().example()
             sage: L.basis()
-            Finite family {0: (1, 0, 0), 1: (0, 1, 0), 2: (0, 0, 1)}
+            Family ((1, 0, 0), (0, 1, 0), (0, 0, 1))
+            sage: L.basis()[1]
+            (0, 1, 0)
         """
-        d = {i: self.element_class(self, b)
-             for i,b in enumerate(self._M.basis())}
-        return Family(d)
+        # A tuple yields an integer-indexed family, which stores the
+        # elements contiguously with no hashing on access.
+        return Family(self._basis_elements)
 
     lie_algebra_generators = basis
 
@@ -252,7 +290,7 @@ class AbelianLieAlgebra(Parent, UniqueRepresentation):
             sage: L.gens()
             ((1, 0, 0), (0, 1, 0), (0, 0, 1))
         """
-        return tuple(self._M.basis())
+        return self._basis_elements
 
     def module(self):
         """
@@ -303,6 +341,25 @@ class AbelianLieAlgebra(Parent, UniqueRepresentation):
         return self.element_class(self, self._M(v))
 
     class Element(BaseExample.Element):
+        # No per-instance attributes beyond those of the wrapper (the
+        # cached ``_nonzero_pairs`` lives in the inherited ``__dict__``).
+        __slots__ = ()
+
+        @lazy_attribute
+        def _nonzero_pairs(self):
+            """
+            The pairs ``(i, c)`` of indices and nonzero coefficients of
+            ``self``, as a tuple.
+
+            EXAMPLES::
+
+                sage: L = LieAlgebras(QQ).FiniteDimensional().WithBasis().example()
+                sage: a, b, c = L.lie_algebra_generators()
+                sage: (2*a - c)._nonzero_pairs
+                ((0, 2), (2, -1))
+            """
+            return tuple(self.value.dict().items())
+
         def __iter__(self):
             """
             Iterate over ``self`` by returning pairs ``(i, c)`` where ``i``
@@ -317,10 +374,7 @@ class AbelianLieAlgebra(Parent, UniqueRepresentation):
                 sage: list(elt)
                 [(0, 2), (2, -1)]
             """
-            zero = self.parent().base_ring().zero()
-            for i, c in self.value.items():
-                if c != zero:
-                    yield (i, c)
+            return iter(self._nonzero_pairs)
 
         def __getitem__(self, i):
             """
@@ -352,7 +406,7 @@ class AbelianLieAlgebra(Parent, UniqueRepresentation):
                 sage: a.bracket(b).bracket(c)
                 (0, 0, 0)
             """
-            return self.parent().zero()
+            return self.parent()._zero_elt
 
         def lift(self):
             """
@@ -368,7 +422,8 @@ class AbelianLieAlgebra(Parent, UniqueRepresentation):
             """
             UEA = self.parent().universal_enveloping_algebra()
             gens = UEA.gens()
-            return UEA.sum(c * gens[i] for i, c in self.value.items())
+            return UEA.linear_combination((gens[i], c)
+                                          for i, c in self.value.dict().items())
 
         def to_vector(self, order=None, sparse=False):
             """